@@ -82,7 +82,7 @@ class HttpCode(IntEnum):
         Get the label of the HTTP status code.
         :return: Label of the HTTP status code.
         """
-        return self.name.replace('_', ' ').title()
+        return _LABELS[self]
 
     def __str__(self) -> str:
         """
@@ -90,3 +90,8 @@ class HttpCode(IntEnum):
         :return: String representation of the HTTP status code.
         """
         return f"{self.value} {self.label()}"
+
+
+# labels never change, so compute them once at import time instead of
+# re-running replace/title on every label() call
+_LABELS = {member: member.name.replace('_', ' ').title() for member in HttpCode}
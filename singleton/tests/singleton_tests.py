@@ -2,6 +2,15 @@ from singleton.singleton.singleton import Singleton
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _reset_singleton():
+    # start every test from a clean slate and leave none behind; a direct
+    # assignment is enough here, no need for monkeypatch's undo stack
+    Singleton._Singleton__instance = None
+    yield
+    Singleton._Singleton__instance = None
+
+
 @pytest.mark.parametrize(
     "args, kwargs",
     [
@@ -57,9 +66,8 @@ def test_singleton_instance_is_not_none():
     # Assert
     assert instance is not None
 
-def test_singleton_instance_reset_for_test(monkeypatch):
-    # Arrange
-    monkeypatch.setattr(Singleton, "_Singleton__instance", None)
+def test_singleton_instance_reset_for_test():
+    # Arrange (the autouse fixture already reset the instance)
 
     # Act
     instance1 = Singleton()
@@ -77,9 +85,9 @@ def test_singleton_instance_reset_for_test(monkeypatch):
     ],
     ids=["no_pre_existing_instance", "pre_existing_instance"]
 )
-def test_singleton_new_branch_coverage(monkeypatch, pre_existing_instance, expected_new_instance):
+def test_singleton_new_branch_coverage(pre_existing_instance, expected_new_instance):
     # Arrange
-    monkeypatch.setattr(Singleton, "_Singleton__instance", pre_existing_instance)
+    Singleton._Singleton__instance = pre_existing_instance
 
     # Act
     instance = Singleton()
@@ -194,6 +194,14 @@ def test_version_lower_than_bad(version1, version2):
     assert not version1 < version2  # Should not be less than or equal to
 
 
+def test_version_long_numeric_prerelease():
+    # numeric identifiers have no length limit in the grammar
+    version1 = Version(1, 0, 0, "1" * 700)
+    version2 = Version(1, 0, 0, "9" * 700)
+    assert version1 < version2
+    assert not version2 < version1
+
+
 def test_version_greater_than():
     version1 = Version(1, 0, 1)
     version2 = Version(1, 0, 0)
@@ -214,6 +222,38 @@ def test_version_less_or_equal():
     assert version3 <= version1  # Should be less than or equal to
 
 
+def test_version_from_strings():
+    versions = Version.from_strings(["1.2.3", "1.0.0-alpha", "2.0.0+build.1"])
+    assert versions == [
+        Version(1, 2, 3),
+        Version(1, 0, 0, "alpha"),
+        Version(2, 0, 0, metadata="build.1"),
+    ]
+
+def test_version_from_strings_invalid():
+    with pytest.raises(ValueError):
+        Version.from_strings(["1.2.3", "invalid.version.string"])
+
+
+def test_version_sort_many():
+    versions = [
+        Version(1, 0, 0),
+        Version(1, 0, 0, "alpha"),
+        Version(2, 0, 0),
+        Version(1, 0, 0, "alpha.1"),
+        Version(0, 9, 9),
+    ]
+    result = Version.sort_many(versions)
+    assert result == [
+        Version(0, 9, 9),
+        Version(1, 0, 0, "alpha"),
+        Version(1, 0, 0, "alpha.1"),
+        Version(1, 0, 0),
+        Version(2, 0, 0),
+    ]
+    assert result is not versions  # Should return a new list
+
+
 def test_version_increment_major():
     version = Version(1, 2, 3)
     version.major_increment()
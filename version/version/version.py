@@ -6,7 +6,148 @@ Compliant with the Semantic Versioning 2.0.0 specification.
 """
 
 import re
-from itertools import zip_longest
+import sys
+from functools import lru_cache
+from operator import attrgetter
+
+_VERSION_IDENTIFIER = r"[0-9a-zA-Z]+(?:\.[0-9a-zA-Z]+)*"
+_VERSION_MAJOR = r"(?P<major>\d+)"
+_VERSION_MINOR = r"(?P<minor>\d+)"
+_VERSION_PATCH = r"(?P<patch>\d+)"
+_VERSION_PRERELEASE = rf"(?P<prerelease>{_VERSION_IDENTIFIER})"
+_VERSION_METADATA = rf"(?P<metadata>{_VERSION_IDENTIFIER})"
+_VERSION_PATTERN = rf"{_VERSION_MAJOR}\.{_VERSION_MINOR}\.{_VERSION_PATCH}(?:-{_VERSION_PRERELEASE})?(?:\+{_VERSION_METADATA})?"
+_RE_VERSION = re.compile(_VERSION_PATTERN, re.ASCII)
+_4_DIGITS_PATTERN = rf"{_VERSION_MAJOR}\.{_VERSION_MINOR}\.{_VERSION_PATCH}\.{_VERSION_PRERELEASE}(?:\+{_VERSION_METADATA})?"
+_RE_4_DIGITS_VERSION = re.compile(_4_DIGITS_PATTERN, re.ASCII)
+# both forms as one alternation, so is_valid_string runs a single regex
+# traversal; no capture groups since validity checks never read them
+_ANY_VERSION_PATTERN = (rf"\d+\.\d+\.\d+(?:-{_VERSION_IDENTIFIER})?(?:\+{_VERSION_IDENTIFIER})?"
+                        rf"|\d+\.\d+\.\d+\.{_VERSION_IDENTIFIER}(?:\+{_VERSION_IDENTIFIER})?")
+_RE_ANY_VERSION = re.compile(_ANY_VERSION_PATTERN, re.ASCII)
+
+# prebuilt template so __repr__ cache misses only pay for str.format,
+# not for re-assembling the f-string pieces each time
+_REPR_FMT = "Version(major={}, minor={}, patch={}, prerelease={}, metadata={})"
+
+# translate() table that deletes every character allowed in a pre-release
+# or metadata identifier; a valid value translates to the empty string
+_ID_DELETE_TABLE = {ord(_char): None
+                    for _char in '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.'}
+
+
+def _to_uint(name: str, value: int|str) -> int:
+    """
+    Coerce a version component to a non-negative int in a single pass.
+
+    Both `isdecimal()` and `int()` run in C; the full-string check rejects
+    the signs, whitespace and underscores that `int()` alone tolerates, so
+    strings are accepted exactly as the original `isdigit()` gate did.
+
+    :param name: Component name, used in the error message
+    :param value: Component value
+    :return: Non-negative integer value
+    """
+    if type(value) is int: # identity check skips the MRO walk on the common path
+        return value
+    if isinstance(value, str) and not (value.isascii() and value.isdecimal()):
+        raise ValueError(f"Invalid {name} version: {value}")
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {name} version: {value}") from None
+    if number < 0:
+        raise ValueError(f"Invalid {name} version: {value}")
+    return number
+
+
+def _encode_prerelease(prerelease: str|None) -> bytes:
+    """
+    Encode a pre-release string into a byte key whose lexicographic order
+    matches SemVer precedence (rule 11).
+
+    Numeric tokens become 0x00 + 4-byte big-endian payload length + the
+    big-endian value (a fixed-width length prefix keeps longer values
+    sorting after shorter ones), other tokens 0x01 + ASCII bytes + 0x00
+    terminator, and the absence of a pre-release a single 0xFF byte so it
+    sorts after any pre-release. Comparing two keys is then a single
+    C-level bytes comparison.
+
+    :param prerelease: Pre-release string, or None
+    :return: Byte key
+    """
+    if prerelease is None:
+        return b'\xff'
+    return _encode_tokens(prerelease.split('.'))
+
+
+def _encode_tokens(tokens: list) -> bytes:
+    """
+    Encode already-split pre-release tokens into the comparison byte key.
+
+    :param tokens: Pre-release tokens
+    :return: Byte key
+    """
+    parts = []
+    for token in tokens:
+        if token.isdigit():
+            value = int(token)
+            payload = value.to_bytes((value.bit_length() + 7) // 8, 'big')
+            # 4-byte length prefix: a 1-byte prefix overflows for numeric
+            # tokens beyond ~616 digits, which the grammar allows
+            parts.append(b'\x00' + len(payload).to_bytes(4, 'big') + payload)
+        else:
+            parts.append(b'\x01' + token.encode('ascii') + b'\x00')
+    return b''.join(parts)
+
+
+# fields to reset to 0 when the given version level is bumped
+# (prerelease and metadata are always cleared)
+_RESET_ON_BUMP = {
+    'major': ('minor', 'patch'),
+    'minor': ('patch',),
+    'patch': (),
+}
+
+
+def _is_valid_id(value: str) -> bool:
+    """
+    Check that a string is made of dot-separated tokens of [0-9a-zA-Z].
+
+    Equivalent to the regex `[0-9a-zA-Z]+(?:\\.[0-9a-zA-Z]+)*` used for
+    pre-release and metadata validation, but implemented with C-level string
+    primitives: translate() deletes every allowed character in one pass (so
+    any leftover character, ASCII or not, means an invalid value) and the
+    dot-placement rules reduce to three boundary/substring checks.
+
+    :param value: String to check
+    :return: True if valid, False otherwise
+    """
+    return (bool(value)
+            and not value.translate(_ID_DELETE_TABLE)
+            and value[0] != '.'
+            and value[-1] != '.'
+            and '..' not in value)
+
+
+def _scan_id(value: str) -> list|None:
+    """
+    Validate a dot-separated identifier and tokenize it in the same pass.
+
+    Accepts the same language as `_is_valid_id`, but hands the split tokens
+    back so the pre-release paths that need them for the comparison key do
+    not split the string a second time.
+
+    :param value: String to check
+    :return: List of tokens, or None if the value is invalid
+    """
+    if not value or value.translate(_ID_DELETE_TABLE):
+        return None
+    tokens = value.split('.')
+    if '' in tokens: # an empty token means a leading, trailing or doubled dot
+        return None
+    return tokens
+
 
 class Version:
     """
@@ -16,33 +157,15 @@ class Version:
     See https://semver.org/lang/fr/spec/v2.0.0.html for more details.
     """
 
-    _RE_PRELEASE_METADATA = re.compile(r'^[0-9a-zA-Z]+(?:\.[0-9a-zA-Z]+)*$')
-
-    __VERSION_MAJOR = r"(?P<major>\d+)"
-    __VERSION_MINOR = r"(?P<minor>\d+)"
-    __VERSION_PATCH = r"(?P<patch>\d+)"
-    __VERSION_PRERELEASE = r"(?P<prerelease>[0-9a-zA-Z]+(?:\.[0-9a-zA-Z]+)*)"
-    __VERSION_METADATA = r"(?P<metadata>[0-9a-zA-Z]+(?:\.[0-9a-zA-Z]+)*)"
-    __VERSION = ('^' + __VERSION_MAJOR
-                     + r'\.'
-                     + __VERSION_MINOR
-                     + r'\.'
-                     + __VERSION_PATCH
-                     + r'(?:-' + __VERSION_PRERELEASE + r')?'
-                     + r'(?:\+' + __VERSION_METADATA + r')?'
-                     + '$')
-    _RE_VERSION = re.compile(__VERSION)
-    _4_DIGITS_VERSION = ( '^' + __VERSION_MAJOR
-                     + r'\.'
-                     + __VERSION_MINOR
-                     + r'\.'
-                     + __VERSION_PATCH
-                     + r'\.'
-                     + __VERSION_PRERELEASE
-                    + r'(?:\+' + __VERSION_METADATA + r')?'
-                    + '$')
-    _RE_4_DIGITS_VERSION = re.compile(_4_DIGITS_VERSION)
+    __slots__ = ('__major', '__minor', '__patch', '__prerelease', '__metadata',
+                 '__pre_key', '__cmp_key', '__str_cache', '__repr_cache', '__hash_cache')
 
+    # fetches the four fields compared by __eq__ in a single C call
+    # (metadata excluded, see https://semver.org/lang/fr/#spec-item-10)
+    _eq_key = attrgetter('major', 'minor', 'patch', 'prerelease')
+
+    # maps the separators to underscores for to_python_version in one pass
+    _PY_VERSION_TRANS = str.maketrans('.-', '__')
 
     def __init__(self,
                  major: int|str,
@@ -60,28 +183,82 @@ class Version:
         :param prerelease: Pre-release version (optional)
         :param metadata: Metadata (optional)
         """
-        if isinstance(major, str):
-            if not major.isdigit():
-                raise ValueError(f"Invalid major version: {major}")
-            major = int(major)
-        if isinstance(minor, str):
-            if not minor.isdigit():
-                raise ValueError(f"Invalid minor version: {minor}")
-            minor = int(minor)
-        if isinstance(patch, str):
-            if not patch.isdigit():
-                raise ValueError(f"Invalid patch version: {patch}")
-            patch = int(patch)
-        if prerelease and not self._RE_PRELEASE_METADATA.match(prerelease):
+        major = _to_uint("major", major)
+        minor = _to_uint("minor", minor)
+        patch = _to_uint("patch", patch)
+        tokens = _scan_id(prerelease) if prerelease else None
+        if prerelease and tokens is None:
             raise ValueError(f"Invalid pre-release version: {prerelease}")
-        if metadata and not self._RE_PRELEASE_METADATA.match(metadata):
+        if metadata and not _is_valid_id(metadata):
             raise ValueError(f"Invalid metadata: {metadata}")
 
         self.__major = major
         self.__minor = minor
         self.__patch = patch
-        self.__prerelease = prerelease
-        self.__metadata = metadata
+        # labels come from a tiny vocabulary (alpha, beta, rc, ...), so
+        # interning collapses duplicates and makes later == checks pointer
+        # comparisons
+        self.__prerelease = sys.intern(prerelease) if prerelease is not None else None
+        self.__metadata = sys.intern(metadata) if metadata is not None else None
+        self.__refresh_prerelease_cache(tokens)
+
+    def __refresh_prerelease_cache(self, tokens: list|None = None) -> None:
+        """
+        Recompute the encoded pre-release comparison key.
+
+        Encoding the pre-release once here means the ordering dunders do not
+        have to re-parse the pre-release string on every comparison. Callers
+        that already tokenized the pre-release for validation pass the tokens
+        along so the string is not split a second time.
+        """
+        if tokens is not None:
+            self.__pre_key = _encode_tokens(tokens)
+        else:
+            self.__pre_key = _encode_prerelease(self.__prerelease)
+        self.__refresh_cmp_key()
+
+    def __refresh_cmp_key(self) -> None:
+        """
+        Recompute the precompiled comparison key.
+
+        The key totally orders Versions per SemVer precedence (metadata
+        excluded), so ordering comparisons are a single C-level tuple compare.
+        """
+        self.__cmp_key = (self.__major, self.__minor, self.__patch, self.__pre_key)
+        self.__invalidate_str_caches()
+
+    def __invalidate_str_caches(self) -> None:
+        """
+        Drop the cached `__str__`/`__repr__`/`__hash__` output after a field change.
+        """
+        self.__str_cache = None
+        self.__repr_cache = None
+        self.__hash_cache = None
+
+    @classmethod
+    def _from_validated(cls, major: int, minor: int, patch: int, prerelease: str|None, metadata: str|None):
+        """
+        Build a Version from parts that are already validated.
+
+        Internal fast path for `from_string` and `from_4_digits`: their
+        regexes already guarantee well-formed parts, so re-running the
+        `__init__` coercion and validation chain would be redundant work.
+
+        :param major: Major version number
+        :param minor: Minor version number
+        :param patch: Patch version number
+        :param prerelease: Pre-release version (optional)
+        :param metadata: Metadata (optional)
+        :return: Version object
+        """
+        obj = cls.__new__(cls)
+        obj.__major = major
+        obj.__minor = minor
+        obj.__patch = patch
+        obj.__prerelease = sys.intern(prerelease) if prerelease is not None else None
+        obj.__metadata = sys.intern(metadata) if metadata is not None else None
+        obj.__refresh_prerelease_cache()
+        return obj
 
     @classmethod
     def from_4_digits(cls, version_str: str):
@@ -109,7 +286,7 @@ class Version:
         # prerelease = prerelease or None
         # metadata = metadata or None
         # return Version(major, minor, patch, prerelease, metadata)
-        match = cls._RE_4_DIGITS_VERSION.match(version_str)
+        match = _RE_4_DIGITS_VERSION.fullmatch(version_str)
         if not match:
             raise ValueError(f"Invalid version string: {version_str}")
 
@@ -119,30 +296,51 @@ class Version:
         prerelease = match.group('prerelease') or None
         metadata = match.group('metadata') or None
 
-        return cls(major, minor, patch, prerelease, metadata)
+        return cls._from_validated(major, minor, patch, prerelease, metadata)
 
     @classmethod
     def from_string(cls, version_str: str):
         """
         Create a Version object from a version string.
 
+        Parsing is memoized, so repeatedly parsing the same string skips the
+        regex work and only pays for the object construction.
+
         :param version_str: Version string
         :return: Version object
         """
-        if cls._RE_4_DIGITS_VERSION.match(version_str):
-            return cls.from_4_digits(version_str)
+        return cls._from_validated(*_parse_version_string(version_str))
 
-        match = cls._RE_VERSION.match(version_str)
-        if not match:
-            raise ValueError(f"Invalid version string: {version_str}")
+    @classmethod
+    def from_strings(cls, version_strs) -> list:
+        """
+        Parse many version strings in one call.
+
+        Binds the parse helper and the trusted constructor once and runs the
+        loop as a list comprehension, so bulk parsing skips the per-call
+        attribute and descriptor lookups of calling `from_string` in a Python
+        loop. Repeated strings still hit the parse cache.
+
+        :param version_strs: Iterable of version strings
+        :return: List of Version objects, in input order
+        """
+        parse = _parse_version_string
+        build = cls._from_validated
+        return [build(*parse(version_str)) for version_str in version_strs]
 
-        major = int(match.group('major'))
-        minor = int(match.group('minor'))
-        patch = int(match.group('patch'))
-        prerelease = match.group('prerelease')
-        metadata = match.group('metadata')
+    @staticmethod
+    def sort_many(versions) -> list:
+        """
+        Sort Version objects by precedence in one pass.
+
+        `sorted(versions)` dispatches a Python-level `__lt__` call for every
+        comparison; extracting the precomputed comparison key once per element
+        lets the whole sort run on C-level tuple compares instead.
 
-        return cls(major, minor, patch, prerelease, metadata)
+        :param versions: Iterable of Version objects
+        :return: New list, in ascending precedence order
+        """
+        return sorted(versions, key=attrgetter('_Version__cmp_key'))
 
     @classmethod
     def is_valid_string(cls, version_str: str) -> bool:
@@ -152,20 +350,30 @@ class Version:
         :param version_str: Version string
         :return: True if valid, False otherwise
         """
-        return bool(cls._RE_VERSION.match(version_str)) or bool(cls._RE_4_DIGITS_VERSION.match(version_str))
+        # cheap prefilter: anything shorter than "0.0.0" or not starting
+        # with a digit cannot be valid, so most garbage never reaches the
+        # regex engine
+        if len(version_str) < 5 or not version_str[0].isdigit():
+            return False
+        return _RE_ANY_VERSION.fullmatch(version_str) is not None
 
     def __str__(self) -> str:
         """
         Return the version as a string.
 
+        Cached until the next mutation, since versions are printed and
+        logged far more often than they change.
+
         :return: Version string
         """
-        version_str = f"{self.__major}.{self.__minor}.{self.__patch}"
-        if self.__prerelease:
-            version_str += f"-{self.__prerelease}"
-        if self.__metadata:
-            version_str += f"+{self.__metadata}"
-        return version_str
+        if self.__str_cache is None:
+            parts = [str(self.__major), '.', str(self.__minor), '.', str(self.__patch)]
+            if self.__prerelease:
+                parts += ('-', self.__prerelease)
+            if self.__metadata:
+                parts += ('+', self.__metadata)
+            self.__str_cache = ''.join(parts)
+        return self.__str_cache
     
     def to_python_version(self) -> str:
         """
@@ -173,30 +381,38 @@ class Version:
 
         :return: Python compatible version string
         """
-        version_str = f"{self.__major}.{self.__minor}.{self.__patch}"
+        parts = [str(self.__major), '.', str(self.__minor), '.', str(self.__patch)]
         if self.__prerelease:
-            prerelease = self.__prerelease.replace('.', '_').replace('-', '_')
-            version_str += f".{prerelease}"
+            parts += ('.', self.__prerelease.translate(self._PY_VERSION_TRANS))
         if self.__metadata:
-            metadata = self.__metadata.replace('.', '_').replace('-', '_')
-            version_str += f".{metadata}"
-        return version_str
+            parts += ('.', self.__metadata.translate(self._PY_VERSION_TRANS))
+        return ''.join(parts)
 
     def __repr__(self) -> str:
         """
         Return a string representation of the Version object.
 
+        Cached until the next mutation, like `__str__`.
+
         :return: String representation
         """
-        return f"Version(major={self.__major}, minor={self.__minor}, patch={self.__patch}, prerelease={self.__prerelease}, metadata={self.__metadata})"
+        if self.__repr_cache is None:
+            self.__repr_cache = _REPR_FMT.format(self.__major, self.__minor, self.__patch,
+                                                 self.__prerelease, self.__metadata)
+        return self.__repr_cache
 
     def __hash__(self):
         """
         Return the hash of the Version object.
 
+        Cached until the next mutation: dicts and sets re-hash the same key
+        object on every probe, so the 5-tuple is only built and hashed once.
+
         :return: Hash value
         """
-        return hash((self.__major, self.__minor, self.__patch, self.__prerelease, self.__metadata))
+        if self.__hash_cache is None:
+            self.__hash_cache = hash((self.__major, self.__minor, self.__patch, self.__prerelease, self.__metadata))
+        return self.__hash_cache
 
     def __eq__(self, other : object) -> bool:
         """
@@ -209,12 +425,16 @@ class Version:
         :param other: Other Version object
         :return: True if equal, False otherwise
         """
-        if not isinstance(other, Version): #pragma: no cover
+        # Version has no subclasses, so the exact type check (a pointer
+        # compare) replaces the isinstance MRO walk here and in the other
+        # comparison dunders
+        if self is other:
+            return True
+        if type(other) is not Version: #pragma: no cover
             return NotImplemented
-        return ( self.__major,  self.__minor,  self.__patch,  self.__prerelease) \
-            == (other.major, other.minor, other.patch, other.prerelease)
+        return Version._eq_key(self) == Version._eq_key(other)
 
-    def __lt__(self, other : object) -> bool: #pylint: disable=too-many-return-statements
+    def __lt__(self, other : object) -> bool:
         """
         Compare two Version objects.
         
@@ -225,39 +445,15 @@ class Version:
         :param other: Other Version object
         :return: True if this version is less than the other, False otherwise
         """
-        if not isinstance(other, Version): #pragma: no cover
+        if self is other:
+            return False
+        if type(other) is not Version: #pragma: no cover
             return NotImplemented
 
-        if self.__major != other.major: # 1.0.0 < 2.0.0
-            return self.__major < other.major
-        if self.__minor != other.minor: # 1.1.0 < 1.2.0
-            return self.__minor < other.minor
-        if self.__patch != other.patch: # 1.1.1 < 1.1.2
-            return self.__patch < other.patch
-
-        # if self.__prerelease is None and other.prerelease is not None: # 1.0.0 < 1.0.0-alpha
-        #     return False
-        # if self.__prerelease is not None and other.prerelease is None: # 1.0.0-alpha < 1.0.0
-        #     return True
-        # if self.__prerelease is None and other.prerelease is None: # 1.0.0 < 1.0.0
-        #     return False
-        if self.__prerelease is None:
-            return False # 1.0.0 > 1.0.0-alpha or 1.0.0 < 1.0.0
-        if other.prerelease is None:
-            return True # 1.0.0-alpha < 1.0.0
-        
-        # case like 1.0.0-alpha < 1.0.0-beta
-
-        self_tokens = self.__prerelease.split('.')
-        other_tokens = other.prerelease.split('.')
-        for self_token, other_token in zip_longest(self_tokens, other_tokens, fillvalue=''):
-            if self_token.isdigit() and other_token.isdigit():
-                if int(self_token) != int(other_token):
-                    return int(self_token) < int(other_token)
-            else:
-                if self_token != other_token:
-                    return self_token < other_token
-        return False
+        # the keys encode the whole precedence (major, minor, patch, then the
+        # pre-release byte key, which already handles "no pre-release sorts
+        # after any pre-release"), so the comparison is one tuple compare
+        return self.__cmp_key < other.__cmp_key
 
     def __gt__(self, other : object) -> bool:
         """
@@ -266,10 +462,10 @@ class Version:
         :param other: Other Version object
         :return: True if this version is greater than the other, False otherwise
         """
-        if not isinstance(other, Version): #pragma: no cover
+        if type(other) is not Version: #pragma: no cover
             return NotImplemented
 
-        return other < self
+        return self.__cmp_key > other.__cmp_key
 
     def __ge__(self, other : object) -> bool:
         """
@@ -278,10 +474,10 @@ class Version:
         :param other: Other Version object
         :return: True if this version is greater than or equal to the other, False otherwise
         """
-        if not isinstance(other, Version): #pragma: no cover
+        if type(other) is not Version: #pragma: no cover
             return NotImplemented
 
-        return self > other or self == other
+        return self.__cmp_key >= other.__cmp_key
 
     def __le__(self, other : object) -> bool:
         """
@@ -290,10 +486,10 @@ class Version:
         :param other: Other Version object
         :return: True if this version is less than or equal to the other, False otherwise
         """
-        if not isinstance(other, Version): #pragma: no cover
+        if type(other) is not Version: #pragma: no cover
             return NotImplemented
 
-        return self < other or self == other
+        return self.__cmp_key <= other.__cmp_key
 
     def __ne__(self, other : object) -> bool:
         """
@@ -302,11 +498,32 @@ class Version:
         :param other: Other Version object
         :return: True if this version is not equal to the other, False otherwise
         """
-        if not isinstance(other, Version): #pragma: no cover
+        if type(other) is not Version: #pragma: no cover
             return NotImplemented
 
         return not self == other
 
+    def _bump(self, level: str, step: int) -> "Version":
+        """
+        Shared implementation of the numeric increment/decrement methods.
+
+        Adds `step` to the given level, resets the lower levels to 0 as
+        listed in `_RESET_ON_BUMP` and clears pre-release and metadata.
+
+        :param level: One of 'major', 'minor' or 'patch'
+        :param step: +1 to increment, -1 to decrement
+        :return: self
+        """
+        value = getattr(self, level) + step
+        if value < 0:
+            raise ValueError(f"Cannot decrement {level} version below 0")
+        setattr(self, level, value)
+        for field in _RESET_ON_BUMP[level]:
+            setattr(self, field, 0)
+        self.prerelease = None
+        self.metadata = None
+        return self
+
     def major_increment(self) -> "Version":
         """
         Increment the major version.\n
@@ -315,12 +532,7 @@ class Version:
 
         :return: self
         """
-        self.__major += 1
-        self.__minor = 0
-        self.__patch = 0
-        self.__prerelease = None
-        self.__metadata = None
-        return self
+        return self._bump('major', 1)
 
     def minor_increment(self) -> "Version":
         """
@@ -330,23 +542,16 @@ class Version:
 
         :return: self
         """
-        self.__minor += 1
-        self.__patch = 0
-        self.__prerelease = None
-        self.__metadata = None
-        return self
+        return self._bump('minor', 1)
 
     def patch_increment(self) -> "Version":
         """
         Increment the patch version.\n
         Reset pre-release and metadata to None.
-        
+
         :return: self
         """
-        self.__patch += 1
-        self.__prerelease = None
-        self.__metadata = None
-        return self
+        return self._bump('patch', 1)
 
     def prerelease_increment(self) -> "Version":
         """
@@ -359,10 +564,11 @@ class Version:
         """
         if self.__prerelease is None:
             raise ValueError("No pre-release version to increment")
-        prerelease_parts = self.__prerelease.split('.')
-        prerelease_parts[-1] = str(int(prerelease_parts[-1]) + 1)
-        self.__prerelease = '.'.join(prerelease_parts)
-        self.__metadata = None
+        # only the last dotted token changes, so slice it off instead of
+        # splitting and re-joining the whole identifier
+        prefix, dot, last = self.__prerelease.rpartition('.')
+        self.prerelease = prefix + dot + str(int(last) + 1)
+        self.metadata = None
         return self
 
     def metadata_increment(self) -> "Version":
@@ -375,9 +581,8 @@ class Version:
         """
         if self.__metadata is None:
             raise ValueError("No metadata version to increment")
-        metadata_parts = self.__metadata.split('.')
-        metadata_parts[-1] = str(int(metadata_parts[-1]) + 1)
-        self.__metadata = '.'.join(metadata_parts)
+        prefix, dot, last = self.__metadata.rpartition('.')
+        self.metadata = prefix + dot + str(int(last) + 1)
         return self
 
     def is_prerelease(self) -> bool:
@@ -404,14 +609,7 @@ class Version:
 
         :return: self
         """
-        if self.__major == 0:
-            raise ValueError("Cannot decrement major version below 0")
-        self.__major -= 1
-        self.__minor = 0
-        self.__patch = 0
-        self.__prerelease = None
-        self.__metadata = None
-        return self
+        return self._bump('major', -1)
 
     def minor_decrement(self) -> "Version":
         """
@@ -421,13 +619,7 @@ class Version:
 
         :return: self
         """
-        if self.__minor == 0:
-            raise ValueError("Cannot decrement minor version below 0")
-        self.__minor -= 1
-        self.__patch = 0
-        self.__prerelease = None
-        self.__metadata = None
-        return self
+        return self._bump('minor', -1)
 
     def patch_decrement(self) -> "Version":
         """
@@ -436,12 +628,7 @@ class Version:
 
         :return: self
         """
-        if self.__patch == 0:
-            raise ValueError("Cannot decrement patch version below 0")
-        self.__patch -= 1
-        self.__prerelease = None
-        self.__metadata = None
-        return self
+        return self._bump('patch', -1)
 
     def prerelease_decrement(self) -> "Version":
         """
@@ -452,12 +639,11 @@ class Version:
         """
         if self.__prerelease is None:
             raise ValueError("No pre-release version to decrement")
-        prerelease_parts = self.__prerelease.split('.')
-        if len(prerelease_parts) == 1:
+        prefix, dot, last = self.__prerelease.rpartition('.')
+        if not dot:
             raise ValueError("Cannot decrement pre-release version below 0")
-        prerelease_parts[-1] = str(int(prerelease_parts[-1]) - 1)
-        self.__prerelease = '.'.join(prerelease_parts)
-        self.__metadata = None
+        self.prerelease = prefix + dot + str(int(last) - 1)
+        self.metadata = None
         return self
 
     @property
@@ -479,6 +665,7 @@ class Version:
         if not isinstance(value, int):
             raise ValueError(f"Invalid major version: {value}")
         self.__major = value
+        self.__refresh_cmp_key()
 
     @property
     def minor(self) -> int:
@@ -499,6 +686,7 @@ class Version:
         if not isinstance(value, int):
             raise ValueError(f"Invalid minor version: {value}")
         self.__minor = value
+        self.__refresh_cmp_key()
 
     @property
     def patch(self) -> int:
@@ -519,6 +707,7 @@ class Version:
         if not isinstance(value, int):
             raise ValueError(f"Invalid patch version: {value}")
         self.__patch = value
+        self.__refresh_cmp_key()
 
     @property
     def prerelease(self) -> str|None:
@@ -536,9 +725,11 @@ class Version:
 
         :param value: Pre-release version
         """
-        if value and not self._RE_PRELEASE_METADATA.match(value):
+        tokens = _scan_id(value) if value else None
+        if value and tokens is None:
             raise ValueError(f"Invalid pre-release version: {value}")
-        self.__prerelease = value
+        self.__prerelease = sys.intern(value) if value is not None else None
+        self.__refresh_prerelease_cache(tokens)
 
     @property
     def metadata(self) -> str|None:
@@ -556,6 +747,44 @@ class Version:
 
         :param value: Metadata version
         """
-        if value and not self._RE_PRELEASE_METADATA.match(value):
+        if value and not _is_valid_id(value):
             raise ValueError(f"Invalid metadata version: {value}")
-        self.__metadata = value
+        self.__metadata = sys.intern(value) if value is not None else None
+        self.__invalidate_str_caches()
+
+
+@lru_cache(maxsize=4096)
+def _parse_version_string(version_str: str) -> tuple:
+    """
+    Parse a version string into its (major, minor, patch, prerelease, metadata) parts.
+
+    The string is taken apart with two partitions and a split instead of a
+    regex: the '+' and '-' separators each cost one C-level scan and the
+    identifier checks reuse `_is_valid_id`, which is much cheaper than a
+    multi-group regex match on valid inputs.
+
+    Cached because version strings tend to repeat a lot (e.g. the same version
+    appearing in many manifests); the tuple of parts is cached rather than a
+    Version instance since Version objects are mutable.
+
+    :param version_str: Version string
+    :return: Tuple of version parts
+    """
+    core, plus, metadata = version_str.partition('+')
+    core, dash, prerelease = core.partition('-')
+    parts = core.split('.')
+    if len(parts) > 3 and not dash:
+        # 4-digits form: everything after the third dot is the pre-release
+        prerelease = '.'.join(parts[3:])
+        parts = parts[:3]
+        dash = '-'
+    # isascii keeps the parser aligned with the re.ASCII validation regexes:
+    # isdecimal alone would accept non-ASCII decimal digits
+    if (len(parts) != 3
+            or not version_str.isascii()
+            or not parts[0].isdecimal() or not parts[1].isdecimal() or not parts[2].isdecimal()
+            or (dash and not (prerelease and _is_valid_id(prerelease)))
+            or (plus and not (metadata and _is_valid_id(metadata)))):
+        raise ValueError(f"Invalid version string: {version_str}")
+
+    return (int(parts[0]), int(parts[1]), int(parts[2]), prerelease or None, metadata or None)